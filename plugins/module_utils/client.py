@@ -7,8 +7,15 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import gzip
 import json
 
+try:
+    # orjson is optional, it only makes (de)serialization of large payloads faster.
+    import orjson
+except ImportError:
+    orjson = None
+
 from ansible.module_utils.urls import Request, basic_auth_header
 
 from .errors import AuthError, ScaleComputingError, UnexpectedAPIResponse
@@ -17,6 +24,9 @@ from ansible.module_utils.six.moves.urllib.error import HTTPError, URLError
 from ansible.module_utils.six.moves.urllib.parse import urlencode, quote
 
 DEFAULT_HEADERS = dict(Accept="application/json")
+# Sent with every request, JSON responses compress well.
+SESSION_HEADERS = {"Accept-Encoding": "gzip"}
+GZIP_MAGIC = b"\x1f\x8b"
 
 
 class Response:
@@ -27,11 +37,19 @@ class Response:
     # Maybe we need/want both.
     def __init__(self, status, data, headers=None):
         self.status = status
-        self.data = data
         # [('h1', 'v1'), ('H2', 'V2')] -> {'h1': 'v1', 'h2': 'V2'}
         self.headers = (
             dict((k.lower(), v) for k, v in dict(headers).items()) if headers else {}
         )
+        # Newer ansible versions decompress gzip responses in Request.open, older
+        # ones do not. Only decompress data that is still gzip compressed.
+        if (
+            self.headers.get("content-encoding", "").lower() == "gzip"
+            and isinstance(data, bytes)
+            and data[:2] == GZIP_MAGIC
+        ):
+            data = gzip.decompress(data)
+        self.data = data
 
         self._json = None
 
@@ -39,8 +57,11 @@ class Response:
     def json(self):
         if self._json is None:
             try:
-                self._json = json.loads(self.data)
-            except ValueError:
+                if orjson:
+                    self._json = orjson.loads(self.data)
+                else:
+                    self._json = json.loads(self.data)
+            except ValueError:  # orjson.JSONDecodeError is a ValueError too
                 raise ScaleComputingError(
                     "Received invalid JSON response: {0}".format(self.data)
                 )
@@ -65,7 +86,10 @@ class Client:
         self.password = password
 
         self._auth_header = None
-        self._client = Request()
+        # One Request object (and with it one cookie jar) is shared by all
+        # calls made through this client, so per-connection options are
+        # configured once here instead of on every request.
+        self._client = Request(validate_certs=False, headers=SESSION_HEADERS)
 
     @property
     def auth_header(self):
@@ -86,7 +110,6 @@ class Client:
                 path,
                 data=data,
                 headers=headers,
-                validate_certs=False,
                 timeout=timeout,
             )
         except HTTPError as e:
@@ -127,7 +150,10 @@ class Client:
             url = "{0}?{1}".format(url, urlencode(query))
         headers = dict(headers or DEFAULT_HEADERS, **self.auth_header)
         if data is not None:
-            data = json.dumps(data, separators=(",", ":"))
+            if orjson:
+                data = orjson.dumps(data).decode("utf-8")
+            else:
+                data = json.dumps(data, separators=(",", ":"))
             headers["Content-type"] = "application/json"
         elif binary_data is not None:
             data = binary_data
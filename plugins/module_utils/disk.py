@@ -44,6 +44,20 @@ TIERING_PRIORITY_DEFAULT = 4
 
 
 class Disk(PayloadMapper):
+    __slots__ = (
+        "uuid",
+        "vm_uuid",
+        "type",
+        "cache_mode",
+        "size",
+        "slot",
+        "name",
+        "disable_snapshotting",
+        "tiering_priority_factor",
+        "mount_points",
+        "read_only",
+    )
+
     def __init__(
         self,
         type,
@@ -14,6 +14,18 @@ from ..module_utils import errors
 
 
 class Nic(PayloadMapper):
+    __slots__ = (
+        "uuid",
+        "vm_uuid",
+        "type",
+        "mac",
+        "mac_new",
+        "vlan",
+        "vlan_new",
+        "connected",
+        "ipv4Addresses",
+    )
+
     def __init__(self):
         self.uuid = None
         self.vm_uuid = None
@@ -17,18 +17,30 @@ def _query(original=None):
     return dict(original or {})
 
 
+def _record_path(endpoint, query):
+    # HyperCore API can not filter records by arbitrary fields, but a single
+    # record can be obtained from <endpoint>/<uuid>.
+    if query and list(query) == ["uuid"] and query["uuid"]:
+        return "{0}/{1}".format(endpoint, query["uuid"])
+    return endpoint
+
+
 class RestClient:
     def __init__(self, client):
         self.client = client
 
     def list_records(self, endpoint, query=None, timeout=None):
         """Results are obtained so that first off, all records are obtained and
-        then filtered manually"""
+        then filtered manually. If records are queried by uuid only, just that
+        record is requested from the endpoint."""
+        path = _record_path(endpoint, query)
         try:
-            records = self.client.get(path=endpoint, timeout=timeout).json
+            response = self.client.get(path=path, timeout=timeout)
         except TimeoutError as e:
             raise errors.ScaleComputingError(f"Request timed out: {e}")
-        return utils.filter_results(records, query)
+        if path != endpoint and response.status == 404:
+            return []
+        return utils.filter_results(response.json, query)
 
     def get_record(self, endpoint, query=None, must_exist=False, timeout=None):
         records = self.list_records(endpoint=endpoint, query=query, timeout=timeout)
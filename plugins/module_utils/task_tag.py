@@ -12,48 +12,72 @@ from time import sleep
 
 from ..module_utils import errors
 
+# Delay (in seconds) between two TaskTag status requests
+TASK_POLL_MIN_DELAY = 0.05
+TASK_POLL_MAX_DELAY = 1.0
+
 
 class TaskTag:
-    @classmethod
-    def wait_task(cls, rest_client, task, check_mode=False):
-        if check_mode:
-            return
+    @staticmethod
+    def _get_task_tag(task):
         if type(task) != dict:
             raise errors.ScaleComputingError("task should be dictionary.")
-        if "taskTag" not in task.keys():
+        if "taskTag" not in task:
             raise errors.ScaleComputingError("taskTag is not in task dictionary.")
-        if not task["taskTag"]:
-            return
+        return task["taskTag"]
 
-        while True:
-            task_status = rest_client.get_record(
-                "{0}/{1}".format("/rest/v1/TaskTag", task["taskTag"]), query={}
+    @staticmethod
+    def _is_task_running(rest_client, task_tag):
+        task_status = rest_client.get_record(
+            "{0}/{1}".format("/rest/v1/TaskTag", task_tag), query={}
+        )
+        if task_status is None:  # No such task_status is found
+            return False
+        if task_status.get("state", "") in (
+            "ERROR",
+            "UNINITIALIZED",
+        ):  # TaskTag has finished unsucessfully or was never initialized, both are errors.
+            raise errors.ScaleComputingError(
+                "There was a problem during this task execution."
             )
-            if task_status is None:  # No such task_status is found
-                break
-            if task_status.get("state", "") in (
-                "ERROR",
-                "UNINITIALIZED",
-            ):  # TaskTag has finished unsucessfully or was never initialized, both are errors.
-                raise errors.ScaleComputingError(
-                    "There was a problem during this task execution."
-                )
-            if task_status.get("state", "") not in (
-                "RUNNING",
-                "QUEUED",
-            ):  # TaskTag has finished
-                break
-            sleep(1)
+        # TaskTag has finished if it is neither running nor queued
+        return task_status.get("state", "") in (
+            "RUNNING",
+            "QUEUED",
+        )
+
+    @classmethod
+    def wait_task(cls, rest_client, task, check_mode=False):
+        cls.wait_tasks(rest_client, [task], check_mode=check_mode)
+
+    @classmethod
+    def wait_tasks(cls, rest_client, tasks, check_mode=False):
+        # Wait for all tasks to finish. Tasks that run on HyperCore in parallel
+        # are all polled in every round, so waiting for N tasks costs as long
+        # as the slowest task instead of the sum of all of them.
+        if check_mode:
+            return
+        pending = [cls._get_task_tag(task) for task in tasks]
+        pending = [task_tag for task_tag in pending if task_tag]
+        # Most tasks finish quickly, so start polling often and back off
+        # exponentially for long running ones.
+        delay = TASK_POLL_MIN_DELAY
+        while pending:
+            pending = [
+                task_tag
+                for task_tag in pending
+                if cls._is_task_running(rest_client, task_tag)
+            ]
+            if pending:
+                sleep(delay)
+                delay = min(delay * 1.5, TASK_POLL_MAX_DELAY)
 
     @staticmethod
     def get_task_status(rest_client, task):
-        if type(task) != dict:
-            raise errors.ScaleComputingError("task should be dictionary.")
-        if "taskTag" not in task.keys():
-            raise errors.ScaleComputingError("taskTag is not in task dictionary.")
-        if not task["taskTag"]:
+        task_tag = TaskTag._get_task_tag(task)
+        if not task_tag:
             return
         task_status = rest_client.get_record(
-            "{0}/{1}".format("/rest/v1/TaskTag", task["taskTag"]), query={}
+            "{0}/{1}".format("/rest/v1/TaskTag", task_tag), query={}
         )
         return task_status if task_status else {}
@@ -60,6 +60,9 @@ class PayloadMapper:
     Every class that will represent module object will (most likely) have to implement those methods.
     """
 
+    # Empty __slots__, so subclasses that define their own __slots__ don't get __dict__.
+    __slots__ = ()
+
     @abstractmethod
     def to_ansible(self):
         """
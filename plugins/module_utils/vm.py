@@ -79,7 +79,6 @@ VM_PAYLOAD_KEYS = [
     "netDevs",
     "numVCPU",
     "tags",
-    "machineType",
 ]
 
 VM_DEVICE_QUERY_MAPPING_ANSIBLE = dict(
@@ -111,6 +110,27 @@ class VM(PayloadMapper):
     # Fields cloudInitData, desiredDisposition and latestTaskTag are left out and won't be transferred between
     # ansible and hypercore transformations
     # power_state inside VM holds ansible-native value (meaning, it can take either started or stopped).
+    __slots__ = (
+        "operating_system",
+        "uuid",
+        "node_uuid",
+        "name",
+        "tags",
+        "description",
+        "mem",
+        "power_state",
+        "numVCPU",
+        "nics",
+        "disks",
+        "boot_devices",
+        "attach_guest_tools_iso",
+        "node_affinity",
+        "snapshot_schedule",
+        "reboot",
+        "was_shutdown_tried",
+        "machine_type",
+    )
+
     def __init__(
         self,
         name,
@@ -245,7 +265,7 @@ class VM(PayloadMapper):
 
     @classmethod
     def create_cloud_init_payload(cls, ansible_dict):
-        if "cloud_init" in ansible_dict.keys() and (
+        if ansible_dict.get("cloud_init") and (
             ansible_dict["cloud_init"]["user_data"]
             or ansible_dict["cloud_init"]["meta_data"]
         ):
@@ -437,14 +457,6 @@ class VM(PayloadMapper):
                     existing_hypercore_nic_with_new = nic
         return existing_hypercore_nic, existing_hypercore_nic_with_new
 
-    def find_disk(self, slot):
-        all_slots = [disk.slot for disk in self.disk_list]
-        if all_slots.count(slot) > 1:
-            raise DeviceNotUnique("disk - vm.py - find_disk()")
-        for disk in self.disk_list:
-            if disk.slot == slot:
-                return disk
-
     def post_vm_payload(self, rest_client, ansible_dict):
         # The rest of the keys from VM_PAYLOAD_KEYS will get set properly automatically
         # Cloud init will be obtained through ansible_dict - If method will be reused outside of vm module,
@@ -487,10 +499,7 @@ class VM(PayloadMapper):
     def delete_unused_nics_to_hypercore_vm(self, module, rest_client, nic_key):
         changed = False
         ansible_nic_uuid_list = [
-            nic["vlan_new"]
-            if ("vlan_new" in nic.keys() and nic["vlan_new"])
-            else nic["vlan"]
-            for nic in module.params[nic_key] or []
+            nic.get("vlan_new") or nic["vlan"] for nic in module.params[nic_key] or []
         ]
         for nic in self.nic_list:
             if nic.vlan not in ansible_nic_uuid_list:
@@ -579,17 +588,27 @@ class VM(PayloadMapper):
         )
         return transform_query(vm_device_raw_query, VM_DEVICE_QUERY_MAPPING_ANSIBLE)
 
-    def get_vm_device(self, desired_vm_object):
+    def get_vm_device(self, desired_vm_object, ansible_nics=None, ansible_disks=None):
+        # ansible_nics and ansible_disks can be passed in by callers that look up
+        # many devices on the same VM, so VM's devices are converted only once.
         vm_device_query = VM.get_vm_device_ansible_query(desired_vm_object)
         if desired_vm_object["type"] == "nic":  # Retrieve Nic object
-            return self.get_specific_nic(vm_device_query)
+            if ansible_nics is None:
+                return self.get_specific_nic(vm_device_query)
+            return VM.filter_specific_objects(ansible_nics, vm_device_query, "Nic")
         vm_device_query["type"] = desired_vm_object["type"]
-        return self.get_specific_disk(vm_device_query)  # Retrieve disk object
+        if ansible_disks is None:
+            return self.get_specific_disk(vm_device_query)  # Retrieve disk object
+        return VM.filter_specific_objects(ansible_disks, vm_device_query, "Disk")
 
     def set_boot_devices_order(self, boot_items):
         boot_order = []
+        ansible_nics = [nic.to_ansible() for nic in self.nics]
+        ansible_disks = [vm_disk.to_ansible() for vm_disk in self.disks]
         for desired_boot_device in boot_items:
-            vm_device = self.get_vm_device(desired_boot_device)
+            vm_device = self.get_vm_device(
+                desired_boot_device, ansible_nics, ansible_disks
+            )
             if not vm_device:
                 continue
             boot_order.append(vm_device["uuid"])
@@ -647,12 +666,15 @@ class VM(PayloadMapper):
 
     @classmethod
     def get_vm_device_list(cls, vm_hypercore_dict):
-        all_vm_devices = vm_hypercore_dict["netDevs"] + vm_hypercore_dict["blockDevs"]
+        # Index devices by uuid once, instead of scanning all of them for each boot device
+        all_vm_devices = {
+            vm_device["uuid"]: vm_device
+            for vm_device in vm_hypercore_dict["netDevs"]
+            + vm_hypercore_dict["blockDevs"]
+        }
         vm_device_list = []
         for vm_device_uuid in vm_hypercore_dict["bootDevices"]:
-            vm_device_hypercore = cls.filter_specific_objects(
-                all_vm_devices, {"uuid": vm_device_uuid}, "Disk or nic"
-            )
+            vm_device_hypercore = all_vm_devices.get(vm_device_uuid)
             if vm_device_hypercore["type"] in DISK_TYPES_HYPERCORE:
                 vm_device_list.append(Disk.from_hypercore(vm_device_hypercore))
             else:  # The device is Nic
@@ -1012,13 +1034,15 @@ class ManageVMDisks:
             raise ScaleComputingError(
                 "If force set to true, items should be set to empty list"
             )
-        # Delete all disks
-        for existing_disk in vm.disks:
-            task_tag = rest_client.delete_record(
+        # Delete all disks, then wait for all delete tasks at once
+        task_tags = [
+            rest_client.delete_record(
                 "{0}/{1}".format("/rest/v1/VirDomainBlockDevice", existing_disk.uuid),
                 module.check_mode,
             )
-            TaskTag.wait_task(rest_client, task_tag, module.check_mode)
+            for existing_disk in vm.disks
+        ]
+        TaskTag.wait_tasks(rest_client, task_tags, module.check_mode)
         return True, [], dict(before=disks_before, after=[]), vm.reboot
 
     @classmethod
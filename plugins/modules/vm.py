@@ -38,30 +38,33 @@ seealso:
   - module: scale_computing.hypercore.vm_import
   - module: scale_computing.hypercore.vm_export
 options:
-  vm_name_new:
+  vm_name:
+    # Description comes from the vm_name fragment, only requiredness differs.
+    required: false
+  vm_name_new: &vm_name_new
     description:
       - Use it to rename a VM.
       - If the VM already exists, VM's new name.
       - Only relevant if I(state=present).
     type: str
-  description:
+  description: &description
     description:
       - VM's description.
       - Only relevant if I(state=present).
         value.
     type: str
-  memory:
+  memory: &memory
     description:
       - VM's physical memory in bytes.
       - Required if I(state=present). Irrelevant if I(state=absent).
     type: int
 
-  vcpu:
+  vcpu: &vcpu
     description:
       - Number of Central processing units on the VM.
       - Required if I(state=present). If I(state=absent), vcpu is not relevant.
     type: int
-  power_state:
+  power_state: &power_state
     description:
       - Desired VM state.
       - States C(PAUSE) and C(LIVEMIGRATE) are not exposed in this module
@@ -69,7 +72,7 @@ options:
     choices: [ start, shutdown, stop, reboot, reset ]
     type: str
     default: start
-  snapshot_schedule:
+  snapshot_schedule: &snapshot_schedule
     description:
       - The name of an existing snapshot_schedule to assign to VM.
       - VM can have 0 or 1 snapshot schedules assigned.
@@ -77,20 +80,20 @@ options:
   state:
     description:
       - Desired state of the VM.
+      - Required if I(vm_name) is set.
+      - Mutually exclusive with I(vms).
     choices: [ present, absent ]
     type: str
-    required: True
-  tags:
+  tags: &tags
     description:
       - Tags of the VM.
       - The first tag determines the group that the VM is going to belong.
     type: list
     elements: str
-  disks:
+  disks: &disks
     description:
       - List of disks we want to create.
       - Required if I(state=present).
-    default: []
     suboptions:
       disk_slot:
         type: int
@@ -122,13 +125,12 @@ options:
         choices: [ none, writeback, writethrough ]
     type: list
     elements: dict
-  nics:
+  nics: &nics
     description:
       - List of network interfaces we want to create.
       - Required if I(state=present).
     type: list
     elements: dict
-    default: []
     suboptions:
       vlan:
         type: int
@@ -150,7 +152,7 @@ options:
         default: true
         description:
           - Is network interface connected or not.
-  boot_devices:
+  boot_devices: &boot_devices
     description:
       - Ordered list of boot devices (disks and nics) you want to set
     type: list
@@ -192,18 +194,80 @@ options:
           - Otherwise, I(iso_name) is not relevant.
           - At least one of I(disk_slot), I(nic_vlan) and i(iso_name) is required to identify the vm device to which
             we're setting the boot order.
-  attach_guest_tools_iso:
+  attach_guest_tools_iso: &attach_guest_tools_iso
     description:
       - If supported by operating system, create an extra device to attach the Scale Guest OS tools ISO.
     default: false
     type: bool
-  machine_type:
+  machine_type: &machine_type
     description:
       - Scale I(Hardware) version.
       - Required if creating a new VM.
       - Only relevant when creating the VM. This property cannot be modified.
     type: str
     choices: [ BIOS, UEFI, vTPM+UEFI ]
+  vms:
+    description:
+      - List of VMs to create, update or delete in a single module invocation.
+      - Every item accepts the same options as a single VM, described above.
+      - VMs are processed concurrently, so VM names have to be unique.
+      - If some VMs fail, the module fails after all VMs are processed, listing the failed
+        VM names. I(changed), I(record) and I(diff) of the VMs that succeeded are still returned.
+      - One of I(vm_name) or I(vms) is required.
+      - Mutually exclusive with all other options except I(cluster_instance).
+    type: list
+    elements: dict
+    # Suboptions alias the top-level options above. Options documented in doc
+    # fragments (and vm_name and state, which are required here) are listed
+    # explicitly, since fragments cannot be aliased.
+    suboptions:
+      vm_name:
+        description:
+          - Virtual machine name.
+          - Used to identify selected virtual machine by name.
+        type: str
+        required: true
+      state:
+        description:
+          - Desired state of the VM.
+        choices: [ present, absent ]
+        type: str
+        required: true
+      vm_name_new: *vm_name_new
+      description: *description
+      memory: *memory
+      vcpu: *vcpu
+      power_state: *power_state
+      snapshot_schedule: *snapshot_schedule
+      tags: *tags
+      disks: *disks
+      nics: *nics
+      boot_devices: *boot_devices
+      attach_guest_tools_iso: *attach_guest_tools_iso
+      machine_type: *machine_type
+      cloud_init:
+        description:
+          - Cloud-init configuration of the VM. See I(cloud_init).
+        type: dict
+        suboptions:
+          user_data:
+            description:
+              - Configuration user-data.
+            type: str
+          meta_data:
+            description:
+              - Configuration meta-data.
+            type: str
+      force_reboot:
+        description:
+          - Can VM be forced to power off and on. See I(force_reboot).
+        type: bool
+        default: false
+      shutdown_timeout:
+        description:
+          - How long does ansible controller wait for VMs response to a shutdown request, in seconds.
+        type: float
+        default: 300
 notes:
   - C(check_mode) is not supported.
 """
@@ -253,12 +317,34 @@ EXAMPLES = r"""
     vm_name: demo-VM
     state: absent
   register: result
+
+- name: Create multiple VMs in a single task
+  scale_computing.hypercore.vm:
+    vms:
+      - vm_name: demo-vm-1
+        state: present
+        memory: "{{ '512 MB' | human_to_bytes }}"
+        vcpu: 2
+        disks:
+          - type: virtio_disk
+            disk_slot: 0
+            size: "{{ '10.1 GB' | human_to_bytes }}"
+        nics:
+          - vlan: 0
+      - vm_name: demo-vm-2
+        state: present
+        memory: "{{ '1 GB' | human_to_bytes }}"
+        vcpu: 4
+        disks: []
+        nics: []
+  register: result
 """
 
 RETURN = r"""
 record:
   description:
     - Created VM, if creating the record. If deleting the record, none is returned.
+    - With I(vms), records of all created, updated or deleted VMs, in the order of I(vms).
   returned: success
   type: list
   sample:
@@ -315,12 +401,15 @@ record:
 vm_rebooted:
   description:
       - Info if reboot of the VM was performed.
+      - With I(vms), true if any of the VMs was rebooted.
   returned: success
   type: bool
   sample:
       vm_rebooted: true
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 from ansible.module_utils.basic import AnsibleModule
 
 from ..module_utils import arguments, errors
@@ -335,6 +424,199 @@ from ..module_utils.vm import (
 from ..module_utils.task_tag import TaskTag
 
 MODULE_PATH = "scale_computing.hypercore.vm"
+_VM_ENDPOINT = "/rest/v1/VirDomain"
+
+
+# Options describing a single VM. Used both at the top level and for every
+# item of the vms list.
+_VM_OPTIONS = dict(
+    vm_name=dict(
+        type="str",
+        required=True,
+    ),
+    vm_name_new=dict(
+        type="str",
+    ),
+    description=dict(
+        type="str",
+    ),
+    memory=dict(
+        type="int",
+    ),
+    vcpu=dict(
+        type="int",
+    ),
+    power_state=dict(
+        type="str",
+        choices=[
+            "start",
+            "shutdown",
+            "stop",
+            "reboot",
+            "reset",
+        ],
+        default="start",
+    ),
+    state=dict(
+        type="str",
+        choices=[
+            "present",
+            "absent",
+        ],
+        required=True,
+    ),
+    force_reboot=dict(
+        type="bool",
+        default=False,
+    ),
+    shutdown_timeout=dict(
+        type="float",
+        default=300,
+    ),
+    tags=dict(type="list", elements="str"),
+    disks=dict(
+        type="list",
+        elements="dict",
+        options=dict(
+            disk_slot=dict(
+                type="int",
+                required=True,
+            ),
+            size=dict(
+                type="int",
+            ),
+            type=dict(
+                type="str",
+                choices=[
+                    "ide_cdrom",
+                    "virtio_disk",
+                    "ide_disk",
+                    "scsi_disk",
+                    "ide_floppy",
+                    "nvram",
+                ],
+                required=True,
+            ),
+            iso_name=dict(
+                type="str",
+            ),
+            cache_mode=dict(
+                type="str",
+                choices=["none", "writeback", "writethrough"],
+            ),
+        ),
+    ),
+    nics=dict(
+        type="list",
+        elements="dict",
+        options=dict(
+            vlan=dict(
+                type="int",
+                default=0,
+            ),
+            connected=dict(
+                type="bool",
+                default=True,
+            ),
+            type=dict(
+                type="str",
+                choices=[
+                    "virtio",
+                    "RTL8139",
+                    "INTEL_E1000",
+                ],
+                default="virtio",
+            ),
+            mac=dict(
+                type="str",
+            ),
+        ),
+    ),
+    boot_devices=dict(
+        type="list",
+        elements="dict",
+        options=dict(
+            type=dict(
+                type="str",
+                choices=[
+                    "nic",
+                    "ide_cdrom",
+                    "virtio_disk",
+                    "ide_disk",
+                    "scsi_disk",
+                    "ide_floppy",
+                    "nvram",
+                ],
+                required=True,
+            ),
+            disk_slot=dict(
+                type="int",
+            ),
+            nic_vlan=dict(
+                type="int",
+            ),
+            iso_name=dict(
+                type="str",
+            ),
+        ),
+    ),
+    attach_guest_tools_iso=dict(type="bool", default=False),
+    cloud_init=dict(
+        type="dict",
+        options=dict(
+            user_data=dict(type="str"),
+            meta_data=dict(type="str"),
+        ),
+    ),
+    snapshot_schedule=dict(
+        type="str",
+    ),
+    machine_type=dict(type="str", choices=["BIOS", "UEFI", "vTPM+UEFI"]),
+)
+
+_REQUIRED_IF = [
+    (
+        "state",
+        "present",
+        (
+            "memory",
+            "vcpu",
+            "disks",
+            "nics",
+        ),
+        False,
+    ),
+]
+
+_ARGUMENT_SPEC = dict(arguments.get_spec("cluster_instance"), **_VM_OPTIONS)
+# At the top level, a VM is described either by the scalar options or by vms.
+_ARGUMENT_SPEC.update(
+    vm_name=dict(
+        type="str",
+    ),
+    state=dict(
+        type="str",
+        choices=[
+            "present",
+            "absent",
+        ],
+    ),
+    vms=dict(
+        type="list",
+        elements="dict",
+        options=_VM_OPTIONS,
+        required_if=_REQUIRED_IF,
+    ),
+)
+
+# Mutual exclusion is checked before defaults are set, so only the options
+# given explicitly next to vms are rejected.
+_MUTUALLY_EXCLUSIVE = [(key, "vms") for key in _VM_OPTIONS]
+_REQUIRED_ONE_OF = [("vm_name", "vms")]
+_REQUIRED_TOGETHER = [("vm_name", "state")]
+
+# Upper bound on the number of VMs from the vms list processed concurrently.
+_MAX_WORKERS = 8
 
 
 def _set_boot_order(module, rest_client, vm, existing_boot_order):
@@ -365,6 +647,7 @@ def _set_vm_params(module, rest_client, vm):
 
 def ensure_present(module, rest_client):
     vm_before = VM.get_by_name(module.params, rest_client)
+    vm_after = None
     reboot = False
     if vm_before:
         before = vm_before.to_ansible()  # for output
@@ -391,7 +674,7 @@ def ensure_present(module, rest_client):
         # Define the payload and create the VM
         payload = new_vm.post_vm_payload(rest_client, module.params)
         task_tag = rest_client.create_record(
-            "/rest/v1/VirDomain",
+            _VM_ENDPOINT,
             payload,
             module.check_mode,
         )
@@ -399,15 +682,22 @@ def ensure_present(module, rest_client):
         # Set boot order
         vm_created = VM.get_by_name(module.params, rest_client)
         existing_boot_order = vm_created.get_boot_device_order()
-        _set_boot_order(module, rest_client, vm_created, existing_boot_order)
+        changed_order, _ = _set_boot_order(
+            module, rest_client, vm_created, existing_boot_order
+        )
         # Set power state
-        if module.params["power_state"] != "shutdown":
+        changed_power_state = module.params["power_state"] != "shutdown"
+        if changed_power_state:
             vm_created.update_vm_power_state(
                 module, rest_client, module.params["power_state"]
             )
+        if not (changed_order or changed_power_state):
+            # Nothing was modified since vm_created was read, no need to read it again.
+            vm_after = vm_created
         changed = True
         name_field = "vm_name"
-    vm_after = VM.get_by_name(module.params, rest_client, name_field=name_field)
+    if vm_after is None:
+        vm_after = VM.get_by_name(module.params, rest_client, name_field=name_field)
     after = vm_after.to_ansible()
     if reboot and module.params["power_state"] not in ["shutdown", "stop"]:
         vm_after.reboot = reboot
@@ -415,20 +705,85 @@ def ensure_present(module, rest_client):
     return changed, [after], dict(before=before, after=after), vm_after.reboot
 
 
-def run(module, rest_client):
+class _VMsError(errors.ScaleComputingError):
+    # Raised when some items of the vms list failed. Carries the result of the
+    # items that succeeded, so that their changes are still reported.
+    def __init__(self, message, result):
+        self.result = result
+        super(_VMsError, self).__init__(message)
+
+
+class _VMItemModule:
+    # Stands in for the AnsibleModule when processing a single item of the vms list,
+    # so that ensure_present and ensure_absent can be reused unchanged.
+    def __init__(self, module, params):
+        self.params = dict(module.params, vms=None, **params)
+        self.check_mode = module.check_mode
+
+
+def _run_vm(module, rest_client):
     if module.params["state"] == "absent":
         return ensure_absent(module, rest_client)
     return ensure_present(module, rest_client)
 
 
+def _run_vms(module, rest_client):
+    vm_names = [params["vm_name"] for params in module.params["vms"]]
+    duplicates = sorted(set(name for name in vm_names if vm_names.count(name) > 1))
+    if duplicates:
+        raise errors.ScaleComputingError(
+            f"VM names in vms must be unique, duplicated: {', '.join(duplicates)}."
+        )
+    item_modules = [_VMItemModule(module, params) for params in module.params["vms"]]
+    # VMs are independent of each other, so they are processed concurrently over
+    # the shared rest_client, overlapping the time spent waiting on HyperCore tasks.
+    # This relies on every request building an identical urllib opener:
+    # ansible's Request.open installs its opener process-wide before urlopen(),
+    # so a worker may send its request through another worker's opener. That is
+    # safe while Client varies only per-request headers and timeout (which are not
+    # part of the opener) and keeps validate_certs, proxies, redirects and the
+    # cookie jar fixed on its shared Request. Per-worker Clients would not help,
+    # since the installed opener is global either way.
+    with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+        futures = [
+            executor.submit(_run_vm, item_module, rest_client)
+            for item_module in item_modules
+        ]
+    changed = reboot = False
+    records, before, after, failures = [], {}, {}, []
+    for vm_name, future in zip(vm_names, futures):
+        # A failed VM must not hide changes already made to the other VMs.
+        try:
+            vm_changed, vm_records, vm_diff, vm_reboot = future.result()
+        except Exception as e:
+            failures.append(f"{vm_name}: {e}")
+            continue
+        changed = changed or vm_changed
+        reboot = reboot or vm_reboot
+        records.extend(vm_records)
+        before[vm_name] = vm_diff.get("before")
+        after[vm_name] = vm_diff.get("after")
+    result = changed, records, dict(before=before, after=after), reboot
+    if failures:
+        raise _VMsError("; ".join(failures), result)
+    return result
+
+
+def run(module, rest_client):
+    if module.params["vms"] is not None:
+        return _run_vms(module, rest_client)
+    return _run_vm(module, rest_client)
+
+
 def ensure_absent(module, rest_client):
     reboot = False
     vm = VM.get_by_name(module.params, rest_client)
     if vm:
-        if vm.power_state != "shutdown":  # First, shut it off and then delete
+        # First, shut it off (unless it isn't running already) and then delete
+        if vm.power_state not in ("shutdown", "stopped", "crashed"):
             vm.update_vm_power_state(module, rest_client, "stop")
         task_tag = rest_client.delete_record(
-            "{0}/{1}".format("/rest/v1/VirDomain", vm.uuid), module.check_mode
+            f"{_VM_ENDPOINT}/{vm.uuid}", module.check_mode
         )
         TaskTag.wait_task(rest_client, task_tag)
         output = vm.to_ansible()
@@ -439,165 +794,11 @@ def ensure_absent(module, rest_client):
 def main():
     module = AnsibleModule(
         supports_check_mode=False,  # False ATM
-        argument_spec=dict(
-            arguments.get_spec("cluster_instance"),
-            vm_name=dict(
-                type="str",
-                required=True,
-            ),
-            vm_name_new=dict(
-                type="str",
-            ),
-            description=dict(
-                type="str",
-            ),
-            memory=dict(
-                type="int",
-            ),
-            vcpu=dict(
-                type="int",
-            ),
-            power_state=dict(
-                type="str",
-                choices=[
-                    "start",
-                    "shutdown",
-                    "stop",
-                    "reboot",
-                    "reset",
-                ],
-                default="start",
-            ),
-            state=dict(
-                type="str",
-                choices=[
-                    "present",
-                    "absent",
-                ],
-                required=True,
-            ),
-            force_reboot=dict(
-                type="bool",
-                default=False,
-            ),
-            shutdown_timeout=dict(
-                type="float",
-                default=300,
-            ),
-            tags=dict(type="list", elements="str"),
-            disks=dict(
-                type="list",
-                elements="dict",
-                options=dict(
-                    disk_slot=dict(
-                        type="int",
-                        required=True,
-                    ),
-                    size=dict(
-                        type="int",
-                    ),
-                    type=dict(
-                        type="str",
-                        choices=[
-                            "ide_cdrom",
-                            "virtio_disk",
-                            "ide_disk",
-                            "scsi_disk",
-                            "ide_floppy",
-                            "nvram",
-                        ],
-                        required=True,
-                    ),
-                    iso_name=dict(
-                        type="str",
-                    ),
-                    cache_mode=dict(
-                        type="str",
-                        choices=["none", "writeback", "writethrough"],
-                    ),
-                ),
-            ),
-            nics=dict(
-                type="list",
-                elements="dict",
-                options=dict(
-                    vlan=dict(
-                        type="int",
-                        default=0,
-                    ),
-                    connected=dict(
-                        type="bool",
-                        default=True,
-                    ),
-                    type=dict(
-                        type="str",
-                        choices=[
-                            "virtio",
-                            "RTL8139",
-                            "INTEL_E1000",
-                        ],
-                        default="virtio",
-                    ),
-                    mac=dict(
-                        type="str",
-                    ),
-                ),
-            ),
-            boot_devices=dict(
-                type="list",
-                elements="dict",
-                options=dict(
-                    type=dict(
-                        type="str",
-                        choices=[
-                            "nic",
-                            "ide_cdrom",
-                            "virtio_disk",
-                            "ide_disk",
-                            "scsi_disk",
-                            "ide_floppy",
-                            "nvram",
-                        ],
-                        required=True,
-                    ),
-                    disk_slot=dict(
-                        type="int",
-                    ),
-                    nic_vlan=dict(
-                        type="int",
-                    ),
-                    iso_name=dict(
-                        type="str",
-                    ),
-                ),
-            ),
-            attach_guest_tools_iso=dict(type="bool", default=False),
-            cloud_init=dict(
-                type="dict",
-                default={},
-                options=dict(
-                    user_data=dict(type="str"),
-                    meta_data=dict(type="str"),
-                ),
-            ),
-            snapshot_schedule=dict(
-                type="str",
-            ),
-            machine_type=dict(type="str", choices=["BIOS", "UEFI", "vTPM+UEFI"]),
-        ),
-        required_if=[
-            (
-                "state",
-                "present",
-                (
-                    "memory",
-                    "vcpu",
-                    "disks",
-                    "nics",
-                ),
-                False,
-            ),
-        ],
+        argument_spec=_ARGUMENT_SPEC,
+        required_if=_REQUIRED_IF,
+        mutually_exclusive=_MUTUALLY_EXCLUSIVE,
+        required_one_of=_REQUIRED_ONE_OF,
+        required_together=_REQUIRED_TOGETHER,
     )
 
     try:
@@ -608,6 +809,11 @@ def main():
         rest_client = RestClient(client)
         changed, record, diff, reboot = run(module, rest_client)
         module.exit_json(changed=changed, record=record, diff=diff, vm_rebooted=reboot)
+    except _VMsError as e:
+        changed, record, diff, reboot = e.result
+        module.fail_json(
+            msg=str(e), changed=changed, record=record, diff=diff, vm_rebooted=reboot
+        )
     except errors.ScaleComputingError as e:
         module.fail_json(msg=str(e))
 
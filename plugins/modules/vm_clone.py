@@ -79,10 +79,35 @@ from ..module_utils.rest_client import RestClient
 from ..module_utils.vm import VM
 from ..module_utils.task_tag import TaskTag
 
+_VM_ENDPOINT = "/rest/v1/VirDomain"
+
+_ARGUMENT_SPEC = dict(
+    arguments.get_spec("cluster_instance"),
+    vm_name=dict(
+        type="str",
+        required=True,
+    ),
+    source_vm_name=dict(
+        type="str",
+        required=True,
+    ),
+    tags=dict(  # We give user a chance to add aditional tags here.
+        type="list", elements="str"
+    ),
+    cloud_init=dict(
+        type="dict",
+        options=dict(
+            user_data=dict(type="str"),
+            meta_data=dict(type="str"),
+        ),
+    ),
+)
+
 
 def run(module, rest_client):
-    # Check if clone_vm already exists
-    if VM.get(query={"name": module.params["vm_name"]}, rest_client=rest_client):
+    # Check if clone_vm already exists.
+    # Raw records are enough here, constructing VM objects would need additional requests.
+    if rest_client.list_records(_VM_ENDPOINT, query={"name": module.params["vm_name"]}):
         return (
             False,
             f"Virtual machine {module.params['vm_name']} already exists.",
@@ -106,28 +131,7 @@ def run(module, rest_client):
 def main():
     module = AnsibleModule(
         supports_check_mode=False,
-        argument_spec=dict(
-            arguments.get_spec("cluster_instance"),
-            vm_name=dict(
-                type="str",
-                required=True,
-            ),
-            source_vm_name=dict(
-                type="str",
-                required=True,
-            ),
-            tags=dict(  # We give user a chance to add aditional tags here.
-                type="list", elements="str"
-            ),
-            cloud_init=dict(
-                type="dict",
-                default={},
-                options=dict(
-                    user_data=dict(type="str"),
-                    meta_data=dict(type="str"),
-                ),
-            ),
-        ),
+        argument_spec=_ARGUMENT_SPEC,
     )
 
     try:
@@ -49,10 +49,10 @@ def vm(mocker):
 
 
 @pytest.fixture
-def task_wait():
-    task_tag = TaskTag
-    task_tag.wait_task = MagicMock(return_value=None)
-    return task_tag
+def task_wait(mocker):
+    mocker.patch.object(TaskTag, "wait_task", return_value=None)
+    mocker.patch.object(TaskTag, "wait_tasks", return_value=None)
+    return TaskTag
 
 
 @pytest.fixture
@@ -7,7 +7,9 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import gzip
 import io
+import json
 import sys
 
 import pytest
@@ -60,7 +62,24 @@ class TestResponseInit:
         with pytest.raises(errors.ScaleComputingError, match="invalid JSON"):
             resp.json
 
+    def test_valid_json_orjson(self, mocker):
+        orjson = pytest.importorskip("orjson")
+        mocker.patch.object(client, "orjson", orjson)
+        resp = client.Response(200, b'{"a": ["b", "c"], "d": 1, "e": "\xc4\x8d"}')
+
+        assert resp.json == {"a": ["b", "c"], "d": 1, "e": "\u010d"}
+
+    @pytest.mark.parametrize("data", [b"Not Found", b"\xff\xfe", "Not Found"])
+    def test_invalid_json_orjson(self, mocker, data):
+        orjson = pytest.importorskip("orjson")
+        mocker.patch.object(client, "orjson", orjson)
+        resp = client.Response(404, data)
+
+        with pytest.raises(errors.ScaleComputingError, match="invalid JSON"):
+            resp.json
+
     def test_json_is_cached(self, mocker):
+        mocker.patch.object(client, "orjson", None)
         json_mock = mocker.patch.object(client, "json")
         resp = client.Response(
             200,
@@ -152,6 +171,31 @@ class TestClientRequest:
         )
         assert resp == mock_response
 
+    def test_request_with_data_orjson(self, mocker):
+        orjson_mock = mocker.patch.object(client, "orjson")
+        orjson_mock.dumps.return_value = b'{"some":"data"}'
+        c = client.Client("https://instance.com", "user", "pass")
+        request_mock = mocker.patch.object(c, "_request")
+
+        c.request("PUT", "api/rest/v1/some/path", data={"some": "data"})
+
+        orjson_mock.dumps.assert_called_once_with({"some": "data"})
+        assert request_mock.call_args.kwargs["data"] == '{"some":"data"}'
+
+    def test_request_with_data_orjson_round_trip(self, mocker):
+        orjson = pytest.importorskip("orjson")
+        mocker.patch.object(client, "orjson", orjson)
+        data = {"some": "data", "list": [1, 2.5, None, True], "name": "\u010d"}
+        c = client.Client("https://instance.com", "user", "pass")
+        request_mock = mocker.patch.object(c, "_request")
+
+        c.request("PUT", "api/rest/v1/some/path", data=data)
+
+        sent = request_mock.call_args.kwargs["data"]
+        assert isinstance(sent, str)
+        assert json.loads(sent) == data
+        assert client.Response(200, sent.encode("utf-8")).json == data
+
     def test_auth_error(self, mocker):
         request_mock = mocker.patch.object(client, "Request").return_value
         request_mock.open.side_effect = HTTPError("", 401, "Unauthorized", {}, None)
@@ -194,6 +238,40 @@ class TestClientRequest:
         path_arg = request_mock.open.call_args.args[1]
         assert path_arg == "https://instance.com/api/rest/v1/some%20path"
 
+    def test_request_object_is_reused(self, mocker):
+        request_class_mock = mocker.patch.object(client, "Request")
+        request_mock = request_class_mock.return_value
+        raw_request = mocker.MagicMock(status=200)
+        raw_request.read.return_value = "{}"
+        request_mock.open.return_value = raw_request
+
+        c = client.Client("https://instance.com", "user", "pass")
+        c.request("GET", "api/rest/v1/some/path")
+        c.request("GET", "api/rest/v1/some/other/path")
+
+        request_class_mock.assert_called_once_with(
+            validate_certs=False, headers={"Accept-Encoding": "gzip"}
+        )
+        assert request_mock.open.call_count == 2
+
+    @pytest.mark.parametrize(
+        "body",
+        [
+            gzip.compress(b'{"a": 1}'),  # not decompressed by Request
+            b'{"a": 1}',  # already decompressed by Request
+        ],
+    )
+    def test_gzip_response(self, mocker, body):
+        request_mock = mocker.patch.object(client, "Request").return_value
+        raw_request = mocker.MagicMock(status=200, headers={"Content-Encoding": "gzip"})
+        raw_request.read.return_value = body
+        request_mock.open.return_value = raw_request
+
+        c = client.Client("https://instance.com", "user", "pass")
+        resp = c.request("GET", "api/rest/v1/some/path")
+
+        assert resp.json == {"a": 1}
+
     @pytest.mark.parametrize("query", [None, {}])
     def test_path_without_query(self, mocker, query):
         request_mock = mocker.patch.object(client, "Request").return_value
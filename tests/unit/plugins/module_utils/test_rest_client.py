@@ -59,6 +59,38 @@ class TestTableListRecords:
             timeout=None,
         )
 
+    def test_query_by_uuid(self, client):
+        client.get.return_value = Response(200, '[{"uuid": "id", "a": 3}]')
+        t = rest_client.RestClient(client)
+
+        records = t.list_records("my_table", dict(uuid="id"))
+
+        assert records == [{"uuid": "id", "a": 3}]
+        client.get.assert_called_once_with(
+            path="my_table/id",
+            timeout=None,
+        )
+
+    def test_query_by_uuid_not_found(self, client):
+        client.get.return_value = Response(404, "Not Found")
+        t = rest_client.RestClient(client)
+
+        records = t.list_records("my_table", dict(uuid="id"))
+
+        assert records == []
+
+    @pytest.mark.parametrize("query", [dict(uuid=""), dict(uuid="id", a=3)])
+    def test_query_not_only_by_uuid(self, client, query):
+        client.get.return_value = Response(200, '[{"uuid": "id", "a": 3}]')
+        t = rest_client.RestClient(client)
+
+        t.list_records("my_table", query)
+
+        client.get.assert_called_once_with(
+            path="my_table",
+            timeout=None,
+        )
+
 
 class TestTableGetRecord:
     def test_zero_matches(self, client):
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+# # Copyright: (c) 2022, XLAB Steampunk <steampunk@xlab.si>
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import sys
+
+import pytest
+
+from ansible_collections.scale_computing.hypercore.plugins.module_utils.task_tag import (
+    TaskTag,
+)
+from ansible_collections.scale_computing.hypercore.plugins.module_utils.errors import (
+    ScaleComputingError,
+)
+
+pytestmark = pytest.mark.skipif(
+    sys.version_info < (2, 7), reason="requires python2.7 or higher"
+)
+
+
+class TestWaitTasks:
+    @pytest.fixture(autouse=True)
+    def sleep_mock(self, mocker):
+        return mocker.patch(
+            "ansible_collections.scale_computing.hypercore.plugins.module_utils.task_tag.sleep"
+        )
+
+    def test_wait_tasks_check_mode(self, rest_client):
+        TaskTag.wait_tasks(rest_client, [dict(taskTag="123")], check_mode=True)
+
+        rest_client.get_record.assert_not_called()
+
+    def test_wait_tasks_empty_task_tags(self, rest_client):
+        TaskTag.wait_tasks(rest_client, [dict(taskTag=""), dict(taskTag=None)])
+
+        rest_client.get_record.assert_not_called()
+
+    def test_wait_tasks_polls_only_pending(self, rest_client, sleep_mock):
+        rest_client.get_record.side_effect = [
+            dict(state="RUNNING"),  # 123, first round
+            dict(state="COMPLETE"),  # 124, first round
+            dict(state="COMPLETE"),  # 123, second round
+        ]
+
+        TaskTag.wait_tasks(rest_client, [dict(taskTag="123"), dict(taskTag="124")])
+
+        assert [c.args[0] for c in rest_client.get_record.call_args_list] == [
+            "/rest/v1/TaskTag/123",
+            "/rest/v1/TaskTag/124",
+            "/rest/v1/TaskTag/123",
+        ]
+        sleep_mock.assert_called_once()
+
+    def test_wait_tasks_backoff(self, rest_client, sleep_mock):
+        rest_client.get_record.side_effect = [dict(state="RUNNING")] * 10 + [
+            dict(state="COMPLETE")
+        ]
+
+        TaskTag.wait_tasks(rest_client, [dict(taskTag="123")])
+
+        delays = [c.args[0] for c in sleep_mock.call_args_list]
+        assert len(delays) == 10
+        assert delays[0] == 0.05
+        assert delays == sorted(delays)
+        assert delays[-1] == 1.0
+
+    def test_wait_tasks_error(self, rest_client):
+        rest_client.get_record.return_value = dict(state="ERROR")
+
+        with pytest.raises(ScaleComputingError, match="problem during this task"):
+            TaskTag.wait_tasks(rest_client, [dict(taskTag="123")])
+
+    def test_wait_tasks_invalid_task(self, rest_client):
+        with pytest.raises(ScaleComputingError, match="taskTag is not in task"):
+            TaskTag.wait_tasks(rest_client, [dict(createdUUID="123")])
@@ -591,7 +591,8 @@ class TestVM:
         ):
             VM.get_or_fail(query={"name": "XLAB-test-vm"}, rest_client=rest_client)
 
-    def test_post_vm_payload_cloud_init_absent(self, rest_client):
+    @pytest.mark.parametrize("ansible_dict", [{}, dict(cloud_init=None)])
+    def test_post_vm_payload_cloud_init_absent(self, rest_client, ansible_dict):
         vm = VM(
             uuid=None,
             name="VM-name",
@@ -608,7 +609,7 @@ class TestVM:
             machine_type="BIOS",
         )
 
-        post_vm_payload = vm.post_vm_payload(rest_client, {})
+        post_vm_payload = vm.post_vm_payload(rest_client, ansible_dict)
 
         assert post_vm_payload == {
             "dom": {
@@ -2,11 +2,16 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import json
 import sys
 
 import pytest
 
+from ansible.module_utils import basic
+from ansible.module_utils._text import to_bytes
+
 from ansible_collections.scale_computing.hypercore.plugins.modules import vm
+from ansible_collections.scale_computing.hypercore.plugins.module_utils import errors
 
 pytestmark = pytest.mark.skipif(
     sys.version_info < (2, 7), reason="requires python2.7 or higher"
@@ -148,6 +153,59 @@ class TestEnsureAbsent:
             False,
         )
 
+    @pytest.mark.parametrize("hypercore_state", ["SHUTOFF", "CRASHED"])
+    def test_ensure_absent_record_present_power_state_not_running(
+        self, create_module, rest_client, task_wait, mocker, hypercore_state
+    ):
+        module = create_module(
+            params=dict(
+                cluster_instance=dict(
+                    host="https://0.0.0.0",
+                    username="admin",
+                    password="admin",
+                ),
+                vm_name="VM-unique-name",
+                state="absent",
+            ),
+        )
+
+        rest_client.get_record.return_value = dict(
+            uuid="id",
+            nodeUUID="",
+            name="VM-name-unique",
+            tags="XLAB-test-tag1,XLAB-test-tag2",
+            description="desc",
+            mem=42,
+            state=hypercore_state,
+            numVCPU=2,
+            netDevs=[],
+            blockDevs=[],
+            bootDevices=[],
+            attachGuestToolsISO=False,
+            operatingSystem=None,
+            affinityStrategy={
+                "strictAffinity": False,
+                "preferredNodeUUID": "",
+                "backupNodeUUID": "",
+            },
+            snapshotScheduleUUID="shapshot-id",
+            machineType="scale-7.2",
+        )
+        mocker.patch(
+            "ansible_collections.scale_computing.hypercore.plugins.module_utils.vm.Node.get_node"
+        ).return_value = None
+        mocker.patch(
+            "ansible_collections.scale_computing.hypercore.plugins.module_utils.vm.SnapshotSchedule.get_snapshot_schedule"
+        ).return_value = None
+        rest_client.delete_record.return_value = None
+
+        result = vm.ensure_absent(module, rest_client)
+
+        # VM isn't running, so no stop action is sent before deleting it
+        rest_client.create_record.assert_not_called()
+        rest_client.delete_record.assert_called_once()
+        assert result[0] is True
+
     def test_ensure_absent_record_present_power_state_not_shutdown(
         self, create_module, rest_client, task_wait, mocker
     ):
@@ -374,28 +432,6 @@ class TestEnsurePresent:
                 snapshotScheduleUUID="snapshot-id",
                 machineType="scale-7.2",
             ),
-            dict(  # vm_after
-                uuid="id",
-                nodeUUID="",
-                name="VM-name-unique",
-                tags="group",
-                description="description",
-                mem=42000,
-                state="SHUTDOWN",
-                numVCPU=2,
-                netDevs=[],
-                blockDevs=[],
-                bootDevices=[],
-                attachGuestToolsISO=False,
-                operatingSystem=None,
-                affinityStrategy={
-                    "strictAffinity": False,
-                    "preferredNodeUUID": "",
-                    "backupNodeUUID": "",
-                },
-                snapshotScheduleUUID="snapshot-id",
-                machineType="scale-7.2",
-            ),
         ]
 
         mocker.patch(
@@ -415,6 +451,8 @@ class TestEnsurePresent:
             "createdUUID": "",
         }
         result = vm.ensure_present(module, rest_client)
+        # vm_after is not read again, since neither boot order nor power state changed
+        assert rest_client.get_record.call_count == 2
         assert result == (
             True,
             [
@@ -1117,28 +1155,6 @@ class TestEnsurePresent:
                 snapshotScheduleUUID="snapshot-id",
                 machineType="scale-7.2",
             ),
-            dict(
-                uuid="id",
-                nodeUUID="",
-                name="VM-name-unique",
-                tags="XLAB-test-tag1,XLAB-test-tag2",
-                description="desc",
-                mem=42,
-                state="SHUTDOWN",
-                numVCPU=2,
-                netDevs=[],
-                blockDevs=[],
-                bootDevices=[],
-                attachGuestToolsISO=False,
-                operatingSystem=None,
-                affinityStrategy={
-                    "strictAffinity": False,
-                    "preferredNodeUUID": "",
-                    "backupNodeUUID": "",
-                },
-                snapshotScheduleUUID="snapshot-id",
-                machineType="scale-7.2",
-            ),
         ]
         mocker.patch(
             "ansible_collections.scale_computing.hypercore.plugins.module_utils.vm.Node.get_node"
@@ -1151,6 +1167,8 @@ class TestEnsurePresent:
             "createdUUID": "",
         }
         result = vm.ensure_present(module, rest_client)
+        # vm_after is not read again, since neither boot order nor power state changed
+        assert rest_client.get_record.call_count == 2
         assert result == (
             True,
             [
@@ -1719,7 +1737,7 @@ class TestMain:
     def test_fail_no_required_fields(self, run_main):
         success, result = run_main(vm)
         assert success is False
-        assert result["msg"] == "missing required arguments: state, vm_name"
+        assert result["msg"] == "one of the following is required: vm_name, vms"
 
     def test_fail_required_if(self, run_main):
         params = dict(
@@ -1735,3 +1753,353 @@ class TestMain:
         assert success is False
         expected_fail_msg = "state is present but all of the following are missing: memory, vcpu, disks, nics"
         assert result["msg"] == expected_fail_msg
+
+    def test_fail_vm_name_and_vms(self, run_main):
+        params = dict(
+            cluster_instance=dict(
+                host="https://0.0.0.0",
+                username="admin",
+                password="admin",
+            ),
+            vm_name="VM-name-unique",
+            state="absent",
+            vms=[dict(vm_name="VM-name-other", state="absent")],
+        )
+        success, result = run_main(vm, params)
+        assert success is False
+        assert "mutually exclusive: vm_name|vms" in result["msg"]
+
+    @pytest.mark.parametrize(
+        "option",
+        [dict(power_state="stop"), dict(memory=5), dict(disks=[])],
+    )
+    def test_fail_vms_and_vm_option(self, run_main, option):
+        params = dict(
+            cluster_instance=dict(
+                host="https://0.0.0.0",
+                username="admin",
+                password="admin",
+            ),
+            vms=[dict(vm_name="VM-name-unique", state="absent")],
+            **option,
+        )
+        success, result = run_main(vm, params)
+        assert success is False
+        assert f"mutually exclusive: {next(iter(option))}|vms" in result["msg"]
+
+    def test_fail_vms_required_if(self, run_main):
+        params = dict(
+            cluster_instance=dict(
+                host="https://0.0.0.0",
+                username="admin",
+                password="admin",
+            ),
+            vms=[dict(vm_name="VM-name-unique", state="present")],
+        )
+        success, result = run_main(vm, params)
+        assert success is False
+        assert (
+            "state is present but all of the following are missing: memory, vcpu, disks, nics"
+            in result["msg"]
+        )
+
+    def test_vms(self, run_main_with_reboot):
+        params = dict(
+            cluster_instance=dict(
+                host="https://0.0.0.0",
+                username="admin",
+                password="admin",
+            ),
+            vms=[
+                dict(vm_name="VM-name-1", state="absent"),
+                dict(
+                    vm_name="VM-name-2",
+                    state="present",
+                    memory=42,
+                    vcpu=2,
+                    disks=[],
+                    nics=[],
+                ),
+            ],
+        )
+        success, result = run_main_with_reboot(vm, params)
+        assert success is True
+
+    def test_vms_item_fails(self, mocker):
+        # Drives main() through the real run() so that the partial results of
+        # the items that succeeded end up in fail_json.
+        args = dict(
+            ANSIBLE_MODULE_ARGS=dict(
+                _ansible_remote_tmp="/tmp",
+                _ansible_keep_remote_files=False,
+                cluster_instance=dict(
+                    host="https://0.0.0.0",
+                    username="admin",
+                    password="admin",
+                ),
+                vms=[
+                    dict(vm_name="VM-1", state="absent"),
+                    dict(vm_name="VM-2", state="absent"),
+                ],
+            ),
+        )
+        mocker.patch.object(basic, "_ANSIBLE_ARGS", to_bytes(json.dumps(args)))
+
+        def ensure_absent(item, client):
+            if item.params["vm_name"] == "VM-2":
+                raise errors.ScaleComputingError("Task failed.")
+            return (
+                True,
+                [dict(vm_name="VM-1")],
+                dict(before=dict(vm_name="VM-1"), after=None),
+                True,
+            )
+
+        mocker.patch.object(vm, "ensure_absent", side_effect=ensure_absent)
+        exit_json = mocker.patch.object(basic.AnsibleModule, "exit_json")
+        fail_json = mocker.patch.object(basic.AnsibleModule, "fail_json")
+
+        vm.main()
+
+        exit_json.assert_not_called()
+        fail_json.assert_called_once_with(
+            msg="VM-2: Task failed.",
+            changed=True,
+            record=[dict(vm_name="VM-1")],
+            diff=dict(before={"VM-1": dict(vm_name="VM-1")}, after={"VM-1": None}),
+            vm_rebooted=True,
+        )
+
+
+class TestRunVms:
+    @staticmethod
+    def vm_params(**kwargs):
+        return dict(
+            dict(
+                vm_name_new=None,
+                description=None,
+                memory=None,
+                vcpu=None,
+                power_state="start",
+                force_reboot=False,
+                shutdown_timeout=300,
+                tags=None,
+                disks=[],
+                nics=[],
+                boot_devices=None,
+                attach_guest_tools_iso=False,
+                cloud_init=None,
+                snapshot_schedule=None,
+                machine_type=None,
+            ),
+            **kwargs,
+        )
+
+    def test_run_vms(self, create_module, rest_client, mocker):
+        module = create_module(
+            params=dict(
+                self.vm_params(
+                    cluster_instance=dict(
+                        host="https://0.0.0.0",
+                        username="admin",
+                        password="admin",
+                    ),
+                    vm_name=None,
+                    state=None,
+                ),
+                vms=[
+                    self.vm_params(vm_name="VM-1", state="present", memory=42),
+                    self.vm_params(vm_name="VM-2", state="absent"),
+                    self.vm_params(vm_name="VM-3", state="absent"),
+                ],
+            )
+        )
+        ensure_present = mocker.patch.object(
+            vm,
+            "ensure_present",
+            return_value=(
+                True,
+                [dict(vm_name="VM-1")],
+                dict(before=None, after=dict(vm_name="VM-1")),
+                True,
+            ),
+        )
+        ensure_absent = mocker.patch.object(
+            vm,
+            "ensure_absent",
+            side_effect=lambda item, client: (
+                (
+                    True,
+                    [dict(vm_name="VM-2")],
+                    dict(before=dict(vm_name="VM-2"), after=None),
+                    False,
+                )
+                if item.params["vm_name"] == "VM-2"
+                else (False, [], dict(), False)
+            ),
+        )
+
+        result = vm.run(module, rest_client)
+
+        assert result == (
+            True,
+            [dict(vm_name="VM-1"), dict(vm_name="VM-2")],
+            dict(
+                before={"VM-1": None, "VM-2": dict(vm_name="VM-2"), "VM-3": None},
+                after={"VM-1": dict(vm_name="VM-1"), "VM-2": None, "VM-3": None},
+            ),
+            True,
+        )
+        item_module = ensure_present.call_args.args[0]
+        assert item_module.params["vm_name"] == "VM-1"
+        assert item_module.params["memory"] == 42
+        assert item_module.params["cluster_instance"]["host"] == "https://0.0.0.0"
+        assert item_module.params["vms"] is None
+        assert item_module.check_mode is False
+        assert ensure_present.call_args.args[1] is rest_client
+        assert sorted(
+            c.args[0].params["vm_name"] for c in ensure_absent.call_args_list
+        ) == ["VM-2", "VM-3"]
+
+    def test_run_vms_item_fails(self, create_module, rest_client, mocker):
+        module = create_module(
+            params=dict(
+                self.vm_params(vm_name=None, state=None),
+                vms=[
+                    self.vm_params(vm_name="VM-1", state="absent"),
+                    self.vm_params(vm_name="VM-2", state="absent"),
+                    self.vm_params(vm_name="VM-3", state="absent"),
+                ],
+            )
+        )
+
+        def ensure_absent(item, client):
+            vm_name = item.params["vm_name"]
+            if vm_name == "VM-2":
+                raise errors.ScaleComputingError("Task failed.")
+            return (
+                True,
+                [dict(vm_name=vm_name)],
+                dict(before=dict(vm_name=vm_name), after=None),
+                False,
+            )
+
+        mocker.patch.object(vm, "ensure_absent", side_effect=ensure_absent)
+
+        with pytest.raises(
+            errors.ScaleComputingError, match="^VM-2: Task failed.$"
+        ) as exc:
+            vm.run(module, rest_client)
+
+        assert exc.value.result == (
+            True,
+            [dict(vm_name="VM-1"), dict(vm_name="VM-3")],
+            dict(
+                before={"VM-1": dict(vm_name="VM-1"), "VM-3": dict(vm_name="VM-3")},
+                after={"VM-1": None, "VM-3": None},
+            ),
+            False,
+        )
+
+    def test_run_vms_real_ensure(self, create_module, rest_client, task_wait, mocker):
+        module = create_module(
+            params=dict(
+                self.vm_params(vm_name=None, state=None),
+                vms=[
+                    self.vm_params(
+                        vm_name="VM-1",
+                        state="present",
+                        description="desc",
+                        memory=42,
+                        vcpu=2,
+                        power_state="shutdown",
+                    ),
+                    self.vm_params(vm_name="VM-2", state="absent"),
+                    self.vm_params(vm_name="VM-3", state="absent"),
+                ],
+            )
+        )
+
+        def hypercore_vm(uuid, name, state):
+            return dict(
+                uuid=uuid,
+                nodeUUID="",
+                name=name,
+                tags="",
+                description="desc",
+                mem=42,
+                state=state,
+                numVCPU=2,
+                netDevs=[],
+                blockDevs=[],
+                bootDevices=[],
+                attachGuestToolsISO=False,
+                operatingSystem=None,
+                affinityStrategy={
+                    "strictAffinity": False,
+                    "preferredNodeUUID": "",
+                    "backupNodeUUID": "",
+                },
+                snapshotScheduleUUID="",
+                machineType="scale-7.2",
+            )
+
+        # Items run concurrently, so answers are keyed by VM name, not call order.
+        records = {
+            "VM-1": iter([None, hypercore_vm("id-1", "VM-1", "SHUTOFF")]),
+            "VM-2": iter([hypercore_vm("id-2", "VM-2", "SHUTOFF")]),
+            "VM-3": iter([None]),
+        }
+        rest_client.get_record.side_effect = lambda endpoint, query, must_exist: next(
+            records[query["name"]]
+        )
+        rest_client.create_record.return_value = dict(taskTag=123, createdUUID="id-1")
+        rest_client.delete_record.return_value = dict(taskTag=124)
+        mocker.patch(
+            "ansible_collections.scale_computing.hypercore.plugins.module_utils.vm.Node.get_node"
+        ).return_value = None
+        mocker.patch(
+            "ansible_collections.scale_computing.hypercore.plugins.module_utils.vm.SnapshotSchedule.get_snapshot_schedule"
+        ).return_value = None
+        post_vm_payload = mocker.patch(
+            "ansible_collections.scale_computing.hypercore.plugins.module_utils.vm.VM.post_vm_payload"
+        )
+
+        changed, records, diff, reboot = vm.run(module, rest_client)
+
+        assert changed is True
+        assert reboot is False
+        assert [record["vm_name"] for record in records] == ["VM-1", "VM-2"]
+        assert diff["before"]["VM-1"] is None
+        assert diff["after"]["VM-1"]["uuid"] == "id-1"
+        assert diff["before"]["VM-2"]["uuid"] == "id-2"
+        assert diff["after"]["VM-2"] is None
+        assert diff["before"]["VM-3"] is None
+        assert diff["after"]["VM-3"] is None
+        assert post_vm_payload.call_args.args[1]["vm_name"] == "VM-1"
+        assert post_vm_payload.call_args.args[1]["memory"] == 42
+        rest_client.create_record.assert_called_once_with(
+            "/rest/v1/VirDomain", post_vm_payload.return_value, False
+        )
+        rest_client.delete_record.assert_called_once_with(
+            "/rest/v1/VirDomain/id-2", False
+        )
+
+    def test_run_vms_duplicate_names(self, create_module, rest_client, mocker):
+        module = create_module(
+            params=dict(
+                self.vm_params(vm_name=None, state=None),
+                vms=[
+                    self.vm_params(vm_name="VM-1", state="absent"),
+                    self.vm_params(vm_name="VM-1", state="present"),
+                ],
+            )
+        )
+        ensure_present = mocker.patch.object(vm, "ensure_present")
+        ensure_absent = mocker.patch.object(vm, "ensure_absent")
+
+        with pytest.raises(errors.ScaleComputingError, match="duplicated: VM-1"):
+            vm.run(module, rest_client)
+
+        ensure_present.assert_not_called()
+        ensure_absent.assert_not_called()
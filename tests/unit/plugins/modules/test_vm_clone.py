@@ -100,15 +100,14 @@ class TestRun:
             )
         )
         rest_client.list_records.side_effect = [[self._get_empty_vm()]]
-        mocker.patch(
-            "ansible_collections.scale_computing.hypercore.plugins.module_utils.vm.Node.get_node"
-        ).return_value = None
-        mocker.patch(
-            "ansible_collections.scale_computing.hypercore.plugins.module_utils.vm.SnapshotSchedule.get_snapshot_schedule"
-        ).return_value = None
         result = vm_clone.run(module, rest_client)
         print(result)
         assert result == (False, "Virtual machine XLAB-test-vm-clone already exists.")
+        rest_client.list_records.assert_called_once_with(
+            "/rest/v1/VirDomain", query={"name": "XLAB-test-vm-clone"}
+        )
+        # Only raw records are needed to check if the clone exists
+        rest_client.get_record.assert_not_called()
 
     def test_run_when_VM_not_found(self, rest_client, create_module):
         module = module = create_module(